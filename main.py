@@ -1,6 +1,7 @@
 import pygame
 import sys
 import os
+import math
 
 pygame.init()
 MIN_WIDTH, MIN_HEIGHT = 1200, 800
@@ -9,6 +10,10 @@ PANEL_WIDTH, PANEL_MARGIN = 320, 20
 BOX_MARGIN, RIGHT_MARGIN = 50, 20
 BUTTON_WIDTH, BUTTON_HEIGHT = 100, 30
 NUM_BARS = 5
+MAX_SPEED = 200
+FPS = 60
+CURTAIN_TRAVEL = 0.02
+SHUTTER_SPEEDS = [1000, 500, 250, 125, 60, 30, 15, 8]
 
 # Detect and round refresh rate
 try:
@@ -42,6 +47,8 @@ speed_warning_allowed = False
 ignored_current_exceed = False
 popup_active = False
 speed_warning_alpha = 0
+warned_speed = speed
+warned_status = None
 
 adjusting_up = False
 adjusting_down = False
@@ -190,6 +197,7 @@ class Renderer:
             ("- Press H to toggle help", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
             ("- Press T to cycle themes", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
             ("- Press M to toggle multibeam", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
+            ("- Press S to cycle target shutter speed", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
             ("- Resize window to adjust area", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
             ("- Press ESC or close window to exit", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
             ("", self.fonts.tiny_font, self.colors.TEXT_SECONDARY),
@@ -212,6 +220,8 @@ class Renderer:
             (f"Strip Status: {'Active' if strip_active else 'Stopped'}", self.fonts.small_font, self.colors.TEXT_PRIMARY),
             (f"Mode: {self.colors.get_mode_name()}", self.fonts.small_font, self.colors.TEXT_PRIMARY),
             (f"Beam Mode: {'Multibeam' if multibeam_enabled else 'Single'}", self.fonts.small_font, self.colors.TEXT_PRIMARY),
+            (f"Target Shutter: {stripe_analyzer.shutter_label()}", self.fonts.small_font, self.colors.TEXT_PRIMARY),
+            (f"Stripe Pattern: {stripe_analyzer.status(speed, multibeam_enabled)}", self.fonts.small_font, self.colors.TEXT_PRIMARY),
             ("", self.fonts.small_font, self.colors.TEXT_SECONDARY)
         ]
         for txt, fnt, col in status:
@@ -223,12 +233,14 @@ class Renderer:
 
         col1, col2 = x, x + 140
         screen.blit(self.fonts.small_font.render("Refresh Rate", True, self.colors.TEXT_PRIMARY), (col1, y))
-        screen.blit(self.fonts.small_font.render("Max px/frame", True, self.colors.TEXT_PRIMARY), (col2, y))
+        screen.blit(self.fonts.small_font.render("Usable px/frame", True, self.colors.TEXT_PRIMARY), (col2, y))
         y += lh
 
-        for rr in COMMON_REFRESH_RATES:
-            screen.blit(self.fonts.tiny_font.render(f"{rr} Hz", True, self.colors.TEXT_SECONDARY), (col1, y))
-            screen.blit(self.fonts.tiny_font.render(f"{rr}", True, self.colors.TEXT_SECONDARY), (col2, y))
+        for rr in stripe_analyzer.rates:
+            col = self.colors.TEXT_PRIMARY if rr == refresh_rate else self.colors.TEXT_SECONDARY
+            usable = stripe_analyzer.format_range(multibeam_enabled, rr)
+            screen.blit(self.fonts.tiny_font.render(f"{rr} Hz", True, col), (col1, y))
+            screen.blit(self.fonts.tiny_font.render(usable, True, col), (col2, y))
             y += lh
 
     def draw_shutter_test_area(self):
@@ -447,27 +459,28 @@ class Renderer:
         cy += 40
 
         # First line
-        popup_surf.blit(
-            self.fonts.small_font.render("You have exceeded the recommended speed", True, self.colors.TEXT_PRIMARY),
-            (bx + 20, cy)
-        )
+        if warned_status is not None:
+            popup_surf.blit(
+                self.fonts.small_font.render(f"Stripes at {warned_speed} px/frame are {warned_status.lower()}", True, self.colors.TEXT_PRIMARY),
+                (bx + 20, cy)
+            )
         cy += 30
 
-        # Max‐speed line
-        recommended = RECOMMENDED_PX_FRAME.get(refresh_rate, refresh_rate)
-        max_line = f"Max for {refresh_rate}Hz is {recommended} px/frame"
+        # Usable-range line
+        usable = stripe_analyzer.format_range(multibeam_enabled)
+        range_line = f"Usable for {refresh_rate}Hz at {stripe_analyzer.shutter_label()} is {usable} px/frame"
         popup_surf.blit(
-            self.fonts.small_font.render(max_line, True, self.colors.TEXT_PRIMARY),
+            self.fonts.small_font.render(range_line, True, self.colors.TEXT_PRIMARY),
             (bx + 20, cy)
         )
         cy += 40
 
         # Explanatory paragraph without commas
         explanation = [
-            "Speed too fast for effective testing. The refresh rate cannot",
-            "adapt to refresh revolving lines. This leads to still lines on",
-            "the screen that will not register an image usable for speed testing.",
-            "Continue at your own risk."
+            "Speed unsuitable for effective testing. At this speed the refresh",
+            "rate samples the moving lines so that they stand still or run",
+            "backwards on the screen and will not register an image usable",
+            "for speed testing. Continue at your own risk."
         ]
         for line in explanation:
             popup_surf.blit(
@@ -493,7 +506,80 @@ class Renderer:
         return ign_btn
 
 
-RECOMMENDED_PX_FRAME = {rr: rr for rr in COMMON_REFRESH_RATES}
+class StripeAnalyzer:
+    # The app draws at most FPS frames per second and the monitor shows the
+    # latest one on each refresh: slower panels skip frames (bigger jumps),
+    # faster ones repeat them, unevenly unless the rate is a multiple of FPS.
+    # Stationary: the strips tilt by less than one strip height while the
+    # shutter curtain crosses the frame, so the camera records flat bands.
+    # Aliased: a jump exceeds half the bar spacing (multibeam) or leaves at
+    # most two positions per sweep (the single beam restarts at -STRIP_HEIGHT
+    # past the box bottom), the exposure smears a strip into the next one, or
+    # uneven frame repeats misplace the strips by more than the exposure hides.
+    STATIONARY, ALIASED, USABLE = "Stationary", "Aliased", "Usable"
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.shutter_index = 0
+        self.rates = sorted(set(COMMON_REFRESH_RATES + [refresh_rate]))
+        self.tables = {}
+        self.usable = {}
+        self.rebuild()
+
+    def rebuild(self):
+        self.tables.clear()
+        self.usable.clear()
+        for rr in self.rates:
+            for multibeam in (False, True):
+                table = [self.classify(v, rr, multibeam) for v in range(MAX_SPEED + 1)]
+                self.tables[(rr, multibeam)] = table
+                speeds = [v for v in range(1, MAX_SPEED + 1) if table[v] == self.USABLE]
+                self.usable[(rr, multibeam)] = (speeds[0], speeds[-1]) if speeds else None
+
+    def classify(self, v, rr, multibeam):
+        changes = min(rr, FPS)
+        mean_jump = v * FPS / changes
+        max_jump = v * math.ceil(FPS / rr) if rr < FPS else v
+        uneven = (FPS % rr if rr < FPS else rr % FPS) != 0
+        judder = v * FPS / max(rr, FPS) if uneven else 0
+        smear = v * FPS / SHUTTER_SPEEDS[self.shutter_index]
+        if multibeam:
+            period = (self.layout.box_height + STRIP_HEIGHT) / NUM_BARS
+            apparent = abs((mean_jump + period / 2) % period - period / 2)
+        else:
+            period = self.layout.box_height + STRIP_HEIGHT
+            apparent = mean_jump
+        if apparent * changes * CURTAIN_TRAVEL < STRIP_HEIGHT:
+            return self.STATIONARY
+        too_fast = max_jump > period / 2 if multibeam else period // max_jump + 1 <= 2
+        if too_fast or smear + STRIP_HEIGHT >= period or judder > STRIP_HEIGHT + smear:
+            return self.ALIASED
+        return self.USABLE
+
+    def status(self, v, multibeam, rr=None):
+        table = self.tables[(refresh_rate if rr is None else rr, multibeam)]
+        return table[min(max(v, 0), MAX_SPEED)]
+
+    def is_usable(self, v, multibeam):
+        return self.status(v, multibeam) == self.USABLE
+
+    def format_range(self, multibeam, rr=None):
+        # Usable speeds form one span: stationary speeds sit below it and every
+        # aliasing limit only tightens with speed (multibeam wraps near multiples
+        # of the bar spacing fall past half the spacing).
+        usable = self.usable[(refresh_rate if rr is None else rr, multibeam)]
+        if usable is None:
+            return "none"
+        lo, hi = usable
+        return f"{lo}" if lo == hi else f"{lo}-{hi}"
+
+    def cycle_shutter(self):
+        self.shutter_index = (self.shutter_index + 1) % len(SHUTTER_SPEEDS)
+        self.rebuild()
+
+    def shutter_label(self):
+        return f"1/{SHUTTER_SPEEDS[self.shutter_index]}"
+
 
 class GameLogic:
     @staticmethod
@@ -525,18 +611,21 @@ class GameLogic:
         screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         frozen_background = None
         layout.update()
+        stripe_analyzer.rebuild()
 
 colors = Colors()
 layout = Layout()
 fonts = FontManager()
 renderer = Renderer(colors, fonts, layout)
 game_logic = GameLogic()
+stripe_analyzer = StripeAnalyzer(layout)
 figure_image = ImageLoader.load_figure_image()
 
 def main():
     global strip_active, show_help, show_warning, warning_acknowledged, ack_start_time
     global speed, strip_y_pos, adjusting_up, adjusting_down, last_adjust_time
     global speed_warning_allowed, ignored_current_exceed, popup_active, speed_warning_alpha
+    global warned_speed, warned_status
     global multibeam_enabled
 
     clock = pygame.time.Clock()
@@ -567,6 +656,9 @@ def main():
                     if not multibeam_enabled:
                         strip_y_pos %= (layout.box_height + STRIP_HEIGHT)
 
+                elif event.key == pygame.K_s and not show_warning:
+                    stripe_analyzer.cycle_shutter()
+
                 elif event.key == pygame.K_UP and not show_warning:
                     adjusting_up = True
                 elif event.key == pygame.K_DOWN and not show_warning:
@@ -611,7 +703,7 @@ def main():
         if not show_warning and not show_help:
             if adjusting_up and current_time - last_adjust_time > ADJUST_INTERVAL:
                 delta = 5 if (pygame.key.get_mods() & (pygame.KMOD_LCTRL | pygame.KMOD_RCTRL)) else 1
-                speed = min(speed + delta, 200)
+                speed = min(speed + delta, MAX_SPEED)
                 last_adjust_time = current_time
             if adjusting_down and current_time - last_adjust_time > ADJUST_INTERVAL:
                 delta = 5 if (pygame.key.get_mods() & (pygame.KMOD_LCTRL | pygame.KMOD_RCTRL)) else 1
@@ -619,11 +711,12 @@ def main():
                 last_adjust_time = current_time
 
         if speed_warning_allowed:
-            recommended = RECOMMENDED_PX_FRAME.get(refresh_rate, refresh_rate)
-            if speed <= recommended:
+            if stripe_analyzer.is_usable(speed, multibeam_enabled):
                 ignored_current_exceed = False
                 popup_active = False
             else:
+                warned_speed = speed
+                warned_status = stripe_analyzer.status(speed, multibeam_enabled)
                 if not ignored_current_exceed and not popup_active:
                     popup_active = True
 
@@ -649,7 +742,7 @@ def main():
             ign_btn = renderer.draw_speed_warning_popup()
 
         pygame.display.flip()
-        clock.tick(60)
+        clock.tick(FPS)
 
     pygame.quit()
     sys.exit()